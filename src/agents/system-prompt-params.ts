@@ -93,17 +93,46 @@ function resolveRepoRoot(params: {
   return undefined;
 }
 
+// The ancestor walk stats up to a dozen directories and the same workspace
+// and cwd come back on every prompt build. Remember positive answers per
+// resolved dir and revalidate each hit with a single stat of <root>/.git, so
+// a repo deleted or moved mid-session falls back to a fresh walk. Misses are
+// never cached: agents routinely git init/clone in their workspace after the
+// gateway starts, and a cached "not a repo" would stick until restart.
+const gitRootCache = new Map<string, string>();
+
+/** @internal */
+export function clearGitRootCache(): void {
+  gitRootCache.clear();
+}
+
+function hasGitEntry(dir: string): boolean {
+  try {
+    const stat = fs.statSync(path.join(dir, ".git"));
+    return stat.isDirectory() || stat.isFile();
+  } catch {
+    return false;
+  }
+}
+
 function findGitRoot(startDir: string): string | null {
-  let current = path.resolve(startDir);
+  const start = path.resolve(startDir);
+  const cached = gitRootCache.get(start);
+  if (cached !== undefined) {
+    if (hasGitEntry(cached)) {
+      return cached;
+    }
+    gitRootCache.delete(start);
+  }
+  let current = start;
+  const visited: string[] = [];
   for (let i = 0; i < 12; i += 1) {
-    const gitPath = path.join(current, ".git");
-    try {
-      const stat = fs.statSync(gitPath);
-      if (stat.isDirectory() || stat.isFile()) {
-        return current;
+    visited.push(current);
+    if (hasGitEntry(current)) {
+      for (const dir of visited) {
+        gitRootCache.set(dir, current);
       }
-    } catch {
-      // ignore missing .git at this level
+      return current;
     }
     const parent = path.dirname(current);
     if (parent === current) {
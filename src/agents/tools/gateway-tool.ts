@@ -79,19 +79,13 @@ export function createGatewayTool(opts?: {
           throw new Error("Gateway restart is disabled. Set commands.restart=true to enable.");
         }
         const sessionKey =
-          typeof params.sessionKey === "string" && params.sessionKey.trim()
-            ? params.sessionKey.trim()
-            : opts?.agentSessionKey?.trim() || undefined;
+          readStringParam(params, "sessionKey") ?? (opts?.agentSessionKey?.trim() || undefined);
         const delayMs =
           typeof params.delayMs === "number" && Number.isFinite(params.delayMs)
             ? Math.floor(params.delayMs)
             : undefined;
-        const reason =
-          typeof params.reason === "string" && params.reason.trim()
-            ? params.reason.trim().slice(0, 200)
-            : undefined;
-        const note =
-          typeof params.note === "string" && params.note.trim() ? params.note.trim() : undefined;
+        const reason = readStringParam(params, "reason")?.slice(0, 200);
+        const note = readStringParam(params, "note");
         // Extract channel + threadId for routing after restart
         // Supports both :thread: (most channels) and :topic: (Telegram)
         const { deliveryContext, threadId } = extractDeliveryInfo(sessionKey);
@@ -124,14 +118,8 @@ export function createGatewayTool(opts?: {
         return jsonResult(scheduled);
       }
 
-      const gatewayUrl =
-        typeof params.gatewayUrl === "string" && params.gatewayUrl.trim()
-          ? params.gatewayUrl.trim()
-          : undefined;
-      const gatewayToken =
-        typeof params.gatewayToken === "string" && params.gatewayToken.trim()
-          ? params.gatewayToken.trim()
-          : undefined;
+      const gatewayUrl = readStringParam(params, "gatewayUrl");
+      const gatewayToken = readStringParam(params, "gatewayToken");
       const timeoutMs =
         typeof params.timeoutMs === "number" && Number.isFinite(params.timeoutMs)
           ? Math.max(1, Math.floor(params.timeoutMs))
@@ -154,11 +142,8 @@ export function createGatewayTool(opts?: {
           baseHash = resolveBaseHashFromSnapshot(snapshot);
         }
         const sessionKey =
-          typeof params.sessionKey === "string" && params.sessionKey.trim()
-            ? params.sessionKey.trim()
-            : opts?.agentSessionKey?.trim() || undefined;
-        const note =
-          typeof params.note === "string" && params.note.trim() ? params.note.trim() : undefined;
+          readStringParam(params, "sessionKey") ?? (opts?.agentSessionKey?.trim() || undefined);
+        const note = readStringParam(params, "note");
         const restartDelayMs =
           typeof params.restartDelayMs === "number" && Number.isFinite(params.restartDelayMs)
             ? Math.floor(params.restartDelayMs)
@@ -180,11 +165,8 @@ export function createGatewayTool(opts?: {
           baseHash = resolveBaseHashFromSnapshot(snapshot);
         }
         const sessionKey =
-          typeof params.sessionKey === "string" && params.sessionKey.trim()
-            ? params.sessionKey.trim()
-            : opts?.agentSessionKey?.trim() || undefined;
-        const note =
-          typeof params.note === "string" && params.note.trim() ? params.note.trim() : undefined;
+          readStringParam(params, "sessionKey") ?? (opts?.agentSessionKey?.trim() || undefined);
+        const note = readStringParam(params, "note");
         const restartDelayMs =
           typeof params.restartDelayMs === "number" && Number.isFinite(params.restartDelayMs)
             ? Math.floor(params.restartDelayMs)
@@ -200,11 +182,8 @@ export function createGatewayTool(opts?: {
       }
       if (action === "update.run") {
         const sessionKey =
-          typeof params.sessionKey === "string" && params.sessionKey.trim()
-            ? params.sessionKey.trim()
-            : opts?.agentSessionKey?.trim() || undefined;
-        const note =
-          typeof params.note === "string" && params.note.trim() ? params.note.trim() : undefined;
+          readStringParam(params, "sessionKey") ?? (opts?.agentSessionKey?.trim() || undefined);
+        const note = readStringParam(params, "note");
         const restartDelayMs =
           typeof params.restartDelayMs === "number" && Number.isFinite(params.restartDelayMs)
             ? Math.floor(params.restartDelayMs)
@@ -18,12 +18,27 @@ type ExtractedLevel<T> = {
   hasDirective: boolean;
 };
 
+// The directive name lists are fixed per call site, so compile each pattern
+// once instead of rebuilding the same RegExp for every inbound message.
+const directiveRegexCache = new Map<string, RegExp>();
+
+const directiveRegex = (names: string[], trailingColon: boolean): RegExp => {
+  const namePattern = names.map(escapeRegExp).join("|");
+  const key = `${trailingColon ? "simple" : "level"}:${namePattern}`;
+  let regex = directiveRegexCache.get(key);
+  if (!regex) {
+    const suffix = trailingColon ? "(?:\\s*:\\s*)?" : "";
+    regex = new RegExp(`(?:^|\\s)\\/(?:${namePattern})(?=$|\\s|:)${suffix}`, "i");
+    directiveRegexCache.set(key, regex);
+  }
+  return regex;
+};
+
 const matchLevelDirective = (
   body: string,
   names: string[],
 ): { start: number; end: number; rawLevel?: string } | null => {
-  const namePattern = names.map(escapeRegExp).join("|");
-  const match = body.match(new RegExp(`(?:^|\\s)\\/(?:${namePattern})(?=$|\\s|:)`, "i"));
+  const match = body.match(directiveRegex(names, false));
   if (!match || match.index === undefined) {
     return null;
   }
@@ -77,10 +92,7 @@ const extractSimpleDirective = (
   body: string,
   names: string[],
 ): { cleaned: string; hasDirective: boolean } => {
-  const namePattern = names.map(escapeRegExp).join("|");
-  const match = body.match(
-    new RegExp(`(?:^|\\s)\\/(?:${namePattern})(?=$|\\s|:)(?:\\s*:\\s*)?`, "i"),
-  );
+  const match = body.match(directiveRegex(names, true));
   const cleaned = match ? body.replace(match[0], " ").replace(/\s+/g, " ").trim() : body.trim();
   return {
     cleaned,
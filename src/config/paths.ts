@@ -56,6 +56,15 @@ export function resolveNewStateDir(homedir: () => string = resolveDefaultHomeDir
  * Can be overridden via OPENCLAW_STATE_DIR.
  * Default: ~/.openclaw
  */
+// The new-vs-legacy probe hits the filesystem and the answer is stable for the
+// lifetime of the process, so remember it per home dir. Overrides bypass this.
+const stateDirByHome = new Map<string, string>();
+
+/** @internal */
+export function clearStateDirCache(): void {
+  stateDirByHome.clear();
+}
+
 export function resolveStateDir(
   env: NodeJS.ProcessEnv = process.env,
   homedir: () => string = envHomedir(env),
@@ -65,10 +74,16 @@ export function resolveStateDir(
   if (override) {
     return resolveUserPath(override, env, effectiveHomedir);
   }
+  const home = effectiveHomedir();
+  const cachedDir = stateDirByHome.get(home);
+  if (cachedDir) {
+    return cachedDir;
+  }
   const newDir = newStateDir(effectiveHomedir);
   const legacyDirs = legacyStateDirs(effectiveHomedir);
   const hasNew = fs.existsSync(newDir);
   if (hasNew) {
+    stateDirByHome.set(home, newDir);
     return newDir;
   }
   const existingLegacy = legacyDirs.find((dir) => {
@@ -78,10 +93,9 @@ export function resolveStateDir(
       return false;
     }
   });
-  if (existingLegacy) {
-    return existingLegacy;
-  }
-  return newDir;
+  const resolved = existingLegacy ?? newDir;
+  stateDirByHome.set(home, resolved);
+  return resolved;
 }
 
 function resolveUserPath(
@@ -1,11 +1,15 @@
-import { describe, expect, it } from "vitest";
-import { fetchDiscord } from "./api.js";
+import { beforeEach, describe, expect, it, vi } from "vitest";
+import { clearDiscordGlobalCooldowns, fetchDiscord } from "./api.js";
 
 function jsonResponse(body: unknown, status = 200) {
   return new Response(JSON.stringify(body), { status });
 }
 
 describe("fetchDiscord", () => {
+  beforeEach(() => {
+    clearDiscordGlobalCooldowns();
+  });
+
   it("formats rate limit payloads without raw JSON", async () => {
     const fetcher = async () =>
       jsonResponse(
@@ -70,4 +74,48 @@ describe("fetchDiscord", () => {
     expect(result).toHaveLength(1);
     expect(calls).toBe(2);
   });
+
+  it("defers the next request after a global rate limit", async () => {
+    vi.useFakeTimers();
+    try {
+      const limited = async () =>
+        jsonResponse(
+          { message: "You are being rate limited.", retry_after: 1, global: true },
+          429,
+        );
+      await expect(
+        fetchDiscord("/users/@me/guilds", "tok-global", limited as typeof fetch, {
+          retry: { attempts: 1 },
+        }),
+      ).rejects.toThrow("failed (429)");
+
+      const ok = vi.fn(async () => jsonResponse([{ id: "1", name: "Guild" }], 200));
+      const second = fetchDiscord("/users/@me/guilds", "tok-global", ok as typeof fetch, {
+        retry: { attempts: 1 },
+      });
+      await vi.advanceTimersByTimeAsync(0);
+      expect(ok).not.toHaveBeenCalled();
+      await vi.advanceTimersByTimeAsync(1000);
+      await second;
+      expect(ok).toHaveBeenCalledTimes(1);
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+
+  it("does not defer requests after a route-scoped rate limit", async () => {
+    const limited = async () =>
+      jsonResponse({ message: "You are being rate limited.", retry_after: 5, global: false }, 429);
+    await expect(
+      fetchDiscord("/users/@me/guilds", "tok-route", limited as typeof fetch, {
+        retry: { attempts: 1 },
+      }),
+    ).rejects.toThrow("failed (429)");
+
+    const ok = vi.fn(async () => jsonResponse([{ id: "1", name: "Guild" }], 200));
+    await fetchDiscord("/users/@me/guilds", "tok-route", ok as typeof fetch, {
+      retry: { attempts: 1 },
+    });
+    expect(ok).toHaveBeenCalledTimes(1);
+  });
 });
@@ -1,5 +1,6 @@
 import { resolveFetch } from "../infra/fetch.js";
 import { resolveRetryConfig, retryAsync, type RetryConfig } from "../infra/retry.js";
+import { sleep } from "../utils.js";
 
 const DISCORD_API_BASE = "https://discord.com/api/v10";
 const DISCORD_API_RETRY_DEFAULTS = {
@@ -88,6 +89,26 @@ export class DiscordApiError extends Error {
   }
 }
 
+// When Discord reports a *global* rate limit, every request for that token is
+// throttled, not just the current route. Stand down until the window passes
+// instead of letting concurrent calls burn their retry budgets on fresh 429s.
+// The window is capped so a bogus retry_after cannot stall every call for
+// the token indefinitely.
+const MAX_GLOBAL_COOLDOWN_MS = DISCORD_API_RETRY_DEFAULTS.maxDelayMs;
+const globalCooldowns = new Map<string, number>();
+
+/** @internal */
+export function clearDiscordGlobalCooldowns(): void {
+  globalCooldowns.clear();
+}
+
+async function awaitGlobalCooldown(token: string) {
+  const waitMs = (globalCooldowns.get(token) ?? 0) - Date.now();
+  if (waitMs > 0) {
+    await sleep(waitMs);
+  }
+}
+
 export type DiscordFetchOptions = {
   retry?: RetryConfig;
   label?: string;
@@ -107,6 +128,7 @@ export async function fetchDiscord<T>(
   const retryConfig = resolveRetryConfig(DISCORD_API_RETRY_DEFAULTS, options?.retry);
   return retryAsync(
     async () => {
+      await awaitGlobalCooldown(token);
       const res = await fetchImpl(`${DISCORD_API_BASE}${path}`, {
         headers: { Authorization: `Bot ${token}` },
       });
@@ -115,6 +137,15 @@ export async function fetchDiscord<T>(
         const detail = formatDiscordApiErrorText(text);
         const suffix = detail ? `: ${detail}` : "";
         const retryAfter = res.status === 429 ? parseRetryAfterSeconds(text, res) : undefined;
+        if (res.status === 429 && retryAfter !== undefined) {
+          const payload = parseDiscordApiErrorPayload(text);
+          if (payload?.global) {
+            globalCooldowns.set(
+              token,
+              Date.now() + Math.min(retryAfter * 1000, MAX_GLOBAL_COOLDOWN_MS),
+            );
+          }
+        }
         throw new DiscordApiError(
           `Discord API ${path} failed (${res.status})${suffix}`,
           res.status,
@@ -2,7 +2,12 @@ import { beforeEach, describe, expect, it, vi } from "vitest";
 import type { OpenClawConfig } from "../config/config.js";
 import { normalizeDiscordMessagingTarget } from "../channels/plugins/normalize/discord.js";
 import { listDiscordDirectoryPeersLive } from "./directory-live.js";
-import { parseDiscordTarget, resolveDiscordChannelId, resolveDiscordTarget } from "./targets.js";
+import {
+  clearDiscordTargetCache,
+  parseDiscordTarget,
+  resolveDiscordChannelId,
+  resolveDiscordTarget,
+} from "./targets.js";
 
 vi.mock("./directory-live.js", () => ({
   listDiscordDirectoryPeersLive: vi.fn(),
@@ -79,6 +84,7 @@ describe("resolveDiscordTarget", () => {
 
   beforeEach(() => {
     listPeers.mockReset();
+    clearDiscordTargetCache();
   });
 
   it("returns a resolved user for usernames", async () => {
@@ -89,6 +95,30 @@ describe("resolveDiscordTarget", () => {
     ).resolves.toMatchObject({ kind: "user", id: "999", normalized: "user:999" });
   });
 
+  it("serves repeat username lookups from the cache", async () => {
+    listPeers.mockResolvedValueOnce([{ kind: "user", id: "user:999", name: "Jane" } as const]);
+
+    await resolveDiscordTarget("jane", { cfg, accountId: "default" });
+    await expect(
+      resolveDiscordTarget("jane", { cfg, accountId: "default" }),
+    ).resolves.toMatchObject({ kind: "user", id: "999" });
+    expect(listPeers).toHaveBeenCalledTimes(1);
+  });
+
+  it("expires cached username lookups after the TTL", async () => {
+    vi.useFakeTimers();
+    try {
+      listPeers.mockResolvedValue([{ kind: "user", id: "user:999", name: "Jane" } as const]);
+
+      await resolveDiscordTarget("jane", { cfg, accountId: "default" });
+      vi.advanceTimersByTime(31_000);
+      await resolveDiscordTarget("jane", { cfg, accountId: "default" });
+      expect(listPeers).toHaveBeenCalledTimes(2);
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+
   it("falls back to parsing when lookup misses", async () => {
     listPeers.mockResolvedValueOnce([]);
     await expect(
@@ -98,6 +98,12 @@ export async function resolveDiscordTarget(
     return directParse ?? parseDiscordTarget(trimmed, parseOptions);
   }
 
+  const cacheKey = userLookupCacheKey(options, trimmed);
+  const cachedUserId = getCachedUserId(cacheKey);
+  if (cachedUserId !== undefined) {
+    return buildMessagingTarget("user", cachedUserId, trimmed);
+  }
+
   // Try to resolve as a username via directory lookup
   try {
     const directoryEntries = await listDiscordDirectoryPeersLive({
@@ -110,6 +116,7 @@ export async function resolveDiscordTarget(
     if (match && match.kind === "user") {
       // Extract user ID from the directory entry (format: "user:<id>")
       const userId = match.id.replace(/^user:/, "");
+      cacheUserId(cacheKey, userId);
       return buildMessagingTarget("user", userId, trimmed);
     }
   } catch {
@@ -121,6 +128,51 @@ export async function resolveDiscordTarget(
   return parseDiscordTarget(trimmed, parseOptions);
 }
 
+// Username lookups fan out to a guild list plus per-guild member searches, so
+// remember resolved ids per account. A small LRU with a short TTL keeps
+// repeat sends within a burst from hitting the directory on every message;
+// entries must not outlive the TTL because Discord handles can be released
+// and reclaimed by a different account, and a stale id would DM the wrong
+// person.
+type CachedUserId = { userId: string; expiresAt: number };
+const resolvedUserIdCache = new Map<string, CachedUserId>();
+const RESOLVED_USER_ID_CACHE_MAX = 200;
+const RESOLVED_USER_ID_TTL_MS = 30_000;
+
+function userLookupCacheKey(options: DirectoryConfigParams, username: string): string {
+  return `${options.accountId ?? "default"}:${username.toLowerCase()}`;
+}
+
+function getCachedUserId(key: string): string | undefined {
+  const entry = resolvedUserIdCache.get(key);
+  if (!entry) {
+    return undefined;
+  }
+  if (entry.expiresAt <= Date.now()) {
+    resolvedUserIdCache.delete(key);
+    return undefined;
+  }
+  // Refresh recency so frequently used names stay resident.
+  resolvedUserIdCache.delete(key);
+  resolvedUserIdCache.set(key, entry);
+  return entry.userId;
+}
+
+function cacheUserId(key: string, userId: string): void {
+  resolvedUserIdCache.set(key, { userId, expiresAt: Date.now() + RESOLVED_USER_ID_TTL_MS });
+  if (resolvedUserIdCache.size > RESOLVED_USER_ID_CACHE_MAX) {
+    const oldest = resolvedUserIdCache.keys().next().value;
+    if (oldest !== undefined) {
+      resolvedUserIdCache.delete(oldest);
+    }
+  }
+}
+
+/** @internal */
+export function clearDiscordTargetCache(): void {
+  resolvedUserIdCache.clear();
+}
+
 function safeParseDiscordTarget(
   input: string,
   options: DiscordTargetParseOptions,
@@ -27,7 +27,7 @@ describe("handleControlUiHttpRequest", () => {
     try {
       await fs.writeFile(path.join(tmp, "index.html"), "<html></html>\n");
       const { res, setHeader } = makeResponse();
-      const handled = handleControlUiHttpRequest(
+      const handled = await handleControlUiHttpRequest(
         { url: "/", method: "GET" } as IncomingMessage,
         res,
         {
@@ -1,5 +1,5 @@
 import type { IncomingMessage, ServerResponse } from "node:http";
-import fs from "node:fs";
+import fs from "node:fs/promises";
 import path from "node:path";
 import type { OpenClawConfig } from "../config/config.js";
 import { resolveControlUiRootSync } from "../infra/control-ui-assets.js";
@@ -83,11 +83,11 @@ function isValidAgentId(agentId: string): boolean {
   return /^[a-z0-9][a-z0-9_-]{0,63}$/i.test(agentId);
 }
 
-export function handleControlUiAvatarRequest(
+export async function handleControlUiAvatarRequest(
   req: IncomingMessage,
   res: ServerResponse,
   opts: { basePath?: string; resolveAvatar: (agentId: string) => ControlUiAvatarResolution },
-): boolean {
+): Promise<boolean> {
   const urlRaw = req.url;
   if (!urlRaw) {
     return false;
@@ -141,7 +141,7 @@ export function handleControlUiAvatarRequest(
     return true;
   }
 
-  serveFile(res, resolved.filePath);
+  await serveFile(res, resolved.filePath);
   return true;
 }
 
@@ -151,13 +151,21 @@ function respondNotFound(res: ServerResponse) {
   res.end("Not Found");
 }
 
-function serveFile(res: ServerResponse, filePath: string) {
+async function serveFile(res: ServerResponse, filePath: string) {
   const ext = path.extname(filePath).toLowerCase();
   res.setHeader("Content-Type", contentTypeForExt(ext));
   // Static UI should never be cached aggressively while iterating; allow the
   // browser to revalidate.
   res.setHeader("Cache-Control", "no-cache");
-  res.end(fs.readFileSync(filePath));
+  res.end(await fs.readFile(filePath));
+}
+
+async function isFile(filePath: string): Promise<boolean> {
+  try {
+    return (await fs.stat(filePath)).isFile();
+  } catch {
+    return false;
+  }
 }
 
 interface ControlUiInjectionOpts {
@@ -195,7 +203,7 @@ interface ServeIndexHtmlOpts {
   agentId?: string;
 }
 
-function serveIndexHtml(res: ServerResponse, indexPath: string, opts: ServeIndexHtmlOpts) {
+async function serveIndexHtml(res: ServerResponse, indexPath: string, opts: ServeIndexHtmlOpts) {
   const { basePath, config, agentId } = opts;
   const identity = config
     ? resolveAssistantIdentity({ cfg: config, agentId })
@@ -212,7 +220,7 @@ function serveIndexHtml(res: ServerResponse, indexPath: string, opts: ServeIndex
     }) ?? identity.avatar;
   res.setHeader("Content-Type", "text/html; charset=utf-8");
   res.setHeader("Cache-Control", "no-cache");
-  const raw = fs.readFileSync(indexPath, "utf8");
+  const raw = await fs.readFile(indexPath, "utf8");
   res.end(
     injectControlUiConfig(raw, {
       basePath,
@@ -236,11 +244,29 @@ function isSafeRelativePath(relPath: string) {
   return true;
 }
 
-export function handleControlUiHttpRequest(
+// The fallback candidate scan probes several directories and its answer is
+// fixed for the process lifetime; resolve it once instead of on every request
+// that arrives without a preloaded root state.
+let fallbackRootResolved = false;
+let fallbackRoot: string | null = null;
+
+function resolveFallbackControlUiRoot(): string | null {
+  if (!fallbackRootResolved) {
+    fallbackRoot = resolveControlUiRootSync({
+      moduleUrl: import.meta.url,
+      argv1: process.argv[1],
+      cwd: process.cwd(),
+    });
+    fallbackRootResolved = true;
+  }
+  return fallbackRoot;
+}
+
+export async function handleControlUiHttpRequest(
   req: IncomingMessage,
   res: ServerResponse,
   opts?: ControlUiRequestOptions,
-): boolean {
+): Promise<boolean> {
   const urlRaw = req.url;
   if (!urlRaw) {
     return false;
@@ -297,14 +323,7 @@ export function handleControlUiHttpRequest(
     return true;
   }
 
-  const root =
-    rootState?.kind === "resolved"
-      ? rootState.path
-      : resolveControlUiRootSync({
-          moduleUrl: import.meta.url,
-          argv1: process.argv[1],
-          cwd: process.cwd(),
-        });
+  const root = rootState?.kind === "resolved" ? rootState.path : resolveFallbackControlUiRoot();
   if (!root) {
     res.statusCode = 503;
     res.setHeader("Content-Type", "text/plain; charset=utf-8");
@@ -339,23 +358,23 @@ export function handleControlUiHttpRequest(
     return true;
   }
 
-  if (fs.existsSync(filePath) && fs.statSync(filePath).isFile()) {
+  if (await isFile(filePath)) {
     if (path.basename(filePath) === "index.html") {
-      serveIndexHtml(res, filePath, {
+      await serveIndexHtml(res, filePath, {
         basePath,
         config: opts?.config,
         agentId: opts?.agentId,
       });
       return true;
     }
-    serveFile(res, filePath);
+    await serveFile(res, filePath);
     return true;
   }
 
   // SPA fallback (client-side router): serve index.html for unknown paths.
   const indexPath = path.join(root, "index.html");
-  if (fs.existsSync(indexPath)) {
-    serveIndexHtml(res, indexPath, {
+  if (await isFile(indexPath)) {
+    await serveIndexHtml(res, indexPath, {
       basePath,
       config: opts?.config,
       agentId: opts?.agentId,
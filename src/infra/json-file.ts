@@ -3,9 +3,8 @@ import path from "node:path";
 
 export function loadJsonFile(pathname: string): unknown {
   try {
-    if (!fs.existsSync(pathname)) {
-      return undefined;
-    }
+    // No existence pre-check: the read itself reports ENOENT and the catch
+    // already maps any failure to undefined, so probing first just adds a stat.
     const raw = fs.readFileSync(pathname, "utf8");
     return JSON.parse(raw) as unknown;
   } catch {
@@ -15,9 +14,8 @@ export function loadJsonFile(pathname: string): unknown {
 
 export function saveJsonFile(pathname: string, data: unknown) {
   const dir = path.dirname(pathname);
-  if (!fs.existsSync(dir)) {
-    fs.mkdirSync(dir, { recursive: true, mode: 0o700 });
-  }
+  // Recursive mkdir is a no-op when the dir exists; skip the separate probe.
+  fs.mkdirSync(dir, { recursive: true, mode: 0o700 });
   fs.writeFileSync(pathname, `${JSON.stringify(data, null, 2)}\n`, "utf8");
   fs.chmodSync(pathname, 0o600);
 }
@@ -2,8 +2,7 @@ import type { Dispatcher } from "undici";
 import { logWarn } from "../../logger.js";
 import { bindAbortRelay } from "../../utils/fetch-timeout.js";
 import {
-  closeDispatcher,
-  createPinnedDispatcher,
+  getPinnedDispatcher,
   resolvePinnedHostnameWithPolicy,
   type LookupFn,
   SsrFBlockedError,
@@ -88,13 +87,14 @@ export async function fetchWithSsrFGuard(params: GuardedFetchOptions): Promise<G
   });
 
   let released = false;
-  const release = async (dispatcher?: Dispatcher | null) => {
+  // Dispatchers are shared per host (see getPinnedDispatcher), so release only
+  // clears the timeout/abort wiring and leaves connections pooled.
+  const release = async () => {
     if (released) {
       return;
     }
     released = true;
     cleanup();
-    await closeDispatcher(dispatcher ?? undefined);
   };
 
   const visited = new Set<string>();
@@ -121,7 +121,7 @@ export async function fetchWithSsrFGuard(params: GuardedFetchOptions): Promise<G
         policy: params.policy,
       });
       if (params.pinDns !== false) {
-        dispatcher = createPinnedDispatcher(pinned);
+        dispatcher = getPinnedDispatcher(pinned);
       }
 
       const init: RequestInit & { dispatcher?: Dispatcher } = {
@@ -136,22 +136,21 @@ export async function fetchWithSsrFGuard(params: GuardedFetchOptions): Promise<G
       if (isRedirectStatus(response.status)) {
         const location = response.headers.get("location");
         if (!location) {
-          await release(dispatcher);
+          await release();
           throw new Error(`Redirect missing location header (${response.status})`);
         }
         redirectCount += 1;
         if (redirectCount > maxRedirects) {
-          await release(dispatcher);
+          await release();
           throw new Error(`Too many redirects (limit: ${maxRedirects})`);
         }
         const nextUrl = new URL(location, parsedUrl).toString();
         if (visited.has(nextUrl)) {
-          await release(dispatcher);
+          await release();
           throw new Error("Redirect loop detected");
         }
         visited.add(nextUrl);
         void response.body?.cancel();
-        await closeDispatcher(dispatcher);
         currentUrl = nextUrl;
         continue;
       }
@@ -159,7 +158,7 @@ export async function fetchWithSsrFGuard(params: GuardedFetchOptions): Promise<G
       return {
         response,
         finalUrl: currentUrl,
-        release: async () => release(dispatcher),
+        release,
       };
     } catch (err) {
       if (err instanceof SsrFBlockedError) {
@@ -168,7 +167,7 @@ export async function fetchWithSsrFGuard(params: GuardedFetchOptions): Promise<G
           `security: blocked URL fetch (${context}) target=${parsedUrl.origin}${parsedUrl.pathname} reason=${err.message}`,
         );
       }
-      await release(dispatcher);
+      await release();
       throw err;
     }
   }
@@ -319,6 +319,30 @@ export function createPinnedDispatcher(pinned: PinnedHostname): Dispatcher {
   });
 }
 
+// Each dispatcher owns its connection pool, so constructing one per request
+// defeats keep-alive entirely. Share dispatchers per pinned (hostname,
+// address set); a DNS change produces a new key and the stale entry ages out.
+const pinnedDispatcherCache = new Map<string, Dispatcher>();
+const PINNED_DISPATCHER_CACHE_MAX = 32;
+
+export function getPinnedDispatcher(pinned: PinnedHostname): Dispatcher {
+  const key = `${pinned.hostname}|${[...pinned.addresses].sort().join(",")}`;
+  let dispatcher = pinnedDispatcherCache.get(key);
+  if (!dispatcher) {
+    dispatcher = createPinnedDispatcher(pinned);
+    pinnedDispatcherCache.set(key, dispatcher);
+    if (pinnedDispatcherCache.size > PINNED_DISPATCHER_CACHE_MAX) {
+      const oldestKey = pinnedDispatcherCache.keys().next().value;
+      if (oldestKey !== undefined) {
+        const oldest = pinnedDispatcherCache.get(oldestKey);
+        pinnedDispatcherCache.delete(oldestKey);
+        void closeDispatcher(oldest);
+      }
+    }
+  }
+  return dispatcher;
+}
+
 export async function closeDispatcher(dispatcher?: Dispatcher | null): Promise<void> {
   if (!dispatcher) {
     return;
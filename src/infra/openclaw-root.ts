@@ -25,11 +25,26 @@ function readPackageNameSync(dir: string): string | null {
   }
 }
 
+// Each ancestor hop costs a package.json read + parse, and the answer for a
+// given start dir never changes while the process runs. Memoize per start dir;
+// on a hit, every dir visited on the way down shares the same root.
+const packageRootCache = new Map<string, string | null>();
+
 async function findPackageRoot(startDir: string, maxDepth = 12): Promise<string | null> {
-  let current = path.resolve(startDir);
+  const start = path.resolve(startDir);
+  const cached = packageRootCache.get(start);
+  if (cached !== undefined) {
+    return cached;
+  }
+  const visited: string[] = [];
+  let current = start;
   for (let i = 0; i < maxDepth; i += 1) {
+    visited.push(current);
     const name = await readPackageName(current);
     if (name && CORE_PACKAGE_NAMES.has(name)) {
+      for (const dir of visited) {
+        packageRootCache.set(dir, current);
+      }
       return current;
     }
     const parent = path.dirname(current);
@@ -38,14 +53,25 @@ async function findPackageRoot(startDir: string, maxDepth = 12): Promise<string
     }
     current = parent;
   }
+  packageRootCache.set(start, null);
   return null;
 }
 
 function findPackageRootSync(startDir: string, maxDepth = 12): string | null {
-  let current = path.resolve(startDir);
+  const start = path.resolve(startDir);
+  const cached = packageRootCache.get(start);
+  if (cached !== undefined) {
+    return cached;
+  }
+  const visited: string[] = [];
+  let current = start;
   for (let i = 0; i < maxDepth; i += 1) {
+    visited.push(current);
     const name = readPackageNameSync(current);
     if (name && CORE_PACKAGE_NAMES.has(name)) {
+      for (const dir of visited) {
+        packageRootCache.set(dir, current);
+      }
       return current;
     }
     const parent = path.dirname(current);
@@ -54,6 +80,7 @@ function findPackageRootSync(startDir: string, maxDepth = 12): string | null {
     }
     current = parent;
   }
+  packageRootCache.set(start, null);
   return null;
 }
 
@@ -0,0 +1,25 @@
+import { messagingApi } from "@line/bot-sdk";
+
+// The access token fully determines a LINE client, and constructing one per
+// call repeats the same setup for every send. Reuse one of each kind per
+// token, mirroring the cached Slack WebClient.
+const clientCache = new Map<string, messagingApi.MessagingApiClient>();
+const blobClientCache = new Map<string, messagingApi.MessagingApiBlobClient>();
+
+export function getLineClient(channelAccessToken: string): messagingApi.MessagingApiClient {
+  let client = clientCache.get(channelAccessToken);
+  if (!client) {
+    client = new messagingApi.MessagingApiClient({ channelAccessToken });
+    clientCache.set(channelAccessToken, client);
+  }
+  return client;
+}
+
+export function getLineBlobClient(channelAccessToken: string): messagingApi.MessagingApiBlobClient {
+  let client = blobClientCache.get(channelAccessToken);
+  if (!client) {
+    client = new messagingApi.MessagingApiBlobClient({ channelAccessToken });
+    blobClientCache.set(channelAccessToken, client);
+  }
+  return client;
+}
@@ -1,8 +1,8 @@
-import { messagingApi } from "@line/bot-sdk";
 import fs from "node:fs";
 import os from "node:os";
 import path from "node:path";
 import { logVerbose } from "../globals.js";
+import { getLineBlobClient } from "./client.js";
 
 interface DownloadResult {
   path: string;
@@ -15,9 +15,7 @@ export async function downloadLineMedia(
   channelAccessToken: string,
   maxBytes = 10 * 1024 * 1024,
 ): Promise<DownloadResult> {
-  const client = new messagingApi.MessagingApiBlobClient({
-    channelAccessToken,
-  });
+  const client = getLineBlobClient(channelAccessToken);
 
   const response = await client.getMessageContent(messageId);
 
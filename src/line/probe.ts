@@ -1,5 +1,5 @@
-import { messagingApi } from "@line/bot-sdk";
 import type { LineProbeResult } from "./types.js";
+import { getLineClient } from "./client.js";
 
 export async function probeLineBot(
   channelAccessToken: string,
@@ -9,9 +9,7 @@ export async function probeLineBot(
     return { ok: false, error: "Channel access token not configured" };
   }
 
-  const client = new messagingApi.MessagingApiClient({
-    channelAccessToken: channelAccessToken.trim(),
-  });
+  const client = getLineClient(channelAccessToken.trim());
 
   try {
     const profile = await withTimeout(client.getBotInfo(), timeoutMs);
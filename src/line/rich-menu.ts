@@ -1,8 +1,9 @@
-import { messagingApi } from "@line/bot-sdk";
+import type { messagingApi } from "@line/bot-sdk";
 import { readFile } from "node:fs/promises";
 import { loadConfig } from "../config/config.js";
 import { logVerbose } from "../globals.js";
 import { resolveLineAccount } from "./accounts.js";
+import { getLineBlobClient, getLineClient } from "./client.js";
 
 type RichMenuRequest = messagingApi.RichMenuRequest;
 type RichMenuResponse = messagingApi.RichMenuResponse;
@@ -61,9 +62,7 @@ function getClient(opts: RichMenuOpts = {}): messagingApi.MessagingApiClient {
   });
   const token = resolveToken(opts.channelAccessToken, account);
 
-  return new messagingApi.MessagingApiClient({
-    channelAccessToken: token,
-  });
+  return getLineClient(token);
 }
 
 function getBlobClient(opts: RichMenuOpts = {}): messagingApi.MessagingApiBlobClient {
@@ -74,9 +73,7 @@ function getBlobClient(opts: RichMenuOpts = {}): messagingApi.MessagingApiBlobCl
   });
   const token = resolveToken(opts.channelAccessToken, account);
 
-  return new messagingApi.MessagingApiBlobClient({
-    channelAccessToken: token,
-  });
+  return getLineBlobClient(token);
 }
 
 /**
@@ -1,9 +1,10 @@
-import { messagingApi } from "@line/bot-sdk";
+import type { messagingApi } from "@line/bot-sdk";
 import type { LineSendResult } from "./types.js";
 import { loadConfig } from "../config/config.js";
 import { logVerbose } from "../globals.js";
 import { recordChannelActivity } from "../infra/channel-activity.js";
 import { resolveLineAccount } from "./accounts.js";
+import { getLineClient } from "./client.js";
 
 // Use the messaging API types directly
 type Message = messagingApi.Message;
@@ -124,9 +125,7 @@ export async function sendMessageLine(
   const token = resolveToken(opts.channelAccessToken, account);
   const chatId = normalizeTarget(to);
 
-  const client = new messagingApi.MessagingApiClient({
-    channelAccessToken: token,
-  });
+  const client = getLineClient(token);
 
   const messages: Message[] = [];
 
@@ -210,9 +209,7 @@ export async function replyMessageLine(
   });
   const token = resolveToken(opts.channelAccessToken, account);
 
-  const client = new messagingApi.MessagingApiClient({
-    channelAccessToken: token,
-  });
+  const client = getLineClient(token);
 
   await client.replyMessage({
     replyToken,
@@ -247,9 +244,7 @@ export async function pushMessagesLine(
   const token = resolveToken(opts.channelAccessToken, account);
   const chatId = normalizeTarget(to);
 
-  const client = new messagingApi.MessagingApiClient({
-    channelAccessToken: token,
-  });
+  const client = getLineClient(token);
 
   await client
     .pushMessage({
@@ -305,9 +300,7 @@ export async function pushImageMessage(
   const token = resolveToken(opts.channelAccessToken, account);
   const chatId = normalizeTarget(to);
 
-  const client = new messagingApi.MessagingApiClient({
-    channelAccessToken: token,
-  });
+  const client = getLineClient(token);
 
   const imageMessage = createImageMessage(originalContentUrl, previewImageUrl);
 
@@ -353,9 +346,7 @@ export async function pushLocationMessage(
   const token = resolveToken(opts.channelAccessToken, account);
   const chatId = normalizeTarget(to);
 
-  const client = new messagingApi.MessagingApiClient({
-    channelAccessToken: token,
-  });
+  const client = getLineClient(token);
 
   const locationMessage = createLocationMessage(location);
 
@@ -397,9 +388,7 @@ export async function pushFlexMessage(
   const token = resolveToken(opts.channelAccessToken, account);
   const chatId = normalizeTarget(to);
 
-  const client = new messagingApi.MessagingApiClient({
-    channelAccessToken: token,
-  });
+  const client = getLineClient(token);
 
   const flexMessage: FlexMessage = {
     type: "flex",
@@ -449,9 +438,7 @@ export async function pushTemplateMessage(
   const token = resolveToken(opts.channelAccessToken, account);
   const chatId = normalizeTarget(to);
 
-  const client = new messagingApi.MessagingApiClient({
-    channelAccessToken: token,
-  });
+  const client = getLineClient(token);
 
   await client.pushMessage({
     to: chatId,
@@ -491,9 +478,7 @@ export async function pushTextMessageWithQuickReplies(
   const token = resolveToken(opts.channelAccessToken, account);
   const chatId = normalizeTarget(to);
 
-  const client = new messagingApi.MessagingApiClient({
-    channelAccessToken: token,
-  });
+  const client = getLineClient(token);
 
   const message = createTextMessageWithQuickReplies(text, quickReplyLabels);
 
@@ -561,9 +546,7 @@ export async function showLoadingAnimation(
   });
   const token = resolveToken(opts.channelAccessToken, account);
 
-  const client = new messagingApi.MessagingApiClient({
-    channelAccessToken: token,
-  });
+  const client = getLineClient(token);
 
   try {
     await client.showLoadingAnimation({
@@ -601,9 +584,7 @@ export async function getUserProfile(
   });
   const token = resolveToken(opts.channelAccessToken, account);
 
-  const client = new messagingApi.MessagingApiClient({
-    channelAccessToken: token,
-  });
+  const client = getLineClient(token);
 
   try {
     const profile = await client.getProfile(userId);
@@ -1,7 +1,7 @@
 import crypto from "node:crypto";
 
 export function validateLineSignature(
-  body: string,
+  body: string | Buffer,
   signature: string,
   channelSecret: string,
 ): boolean {
@@ -10,22 +10,22 @@ export interface LineWebhookOptions {
   runtime?: RuntimeEnv;
 }
 
-function readRawBody(req: Request): string | null {
-  const rawBody =
+function readRawBody(req: Request): string | Buffer | null {
+  // Keep the Buffer as-is: HMAC verification consumes it directly, so there is
+  // no need for a UTF-8 decode (and re-encode) per webhook.
+  return (
     (req as { rawBody?: string | Buffer }).rawBody ??
-    (typeof req.body === "string" || Buffer.isBuffer(req.body) ? req.body : null);
-  if (!rawBody) {
-    return null;
-  }
-  return Buffer.isBuffer(rawBody) ? rawBody.toString("utf-8") : rawBody;
+    (typeof req.body === "string" || Buffer.isBuffer(req.body) ? req.body : null)
+  );
 }
 
-function parseWebhookBody(req: Request, rawBody: string): WebhookRequestBody | null {
+function parseWebhookBody(req: Request, rawBody: string | Buffer): WebhookRequestBody | null {
   if (req.body && typeof req.body === "object" && !Buffer.isBuffer(req.body)) {
     return req.body as WebhookRequestBody;
   }
   try {
-    return JSON.parse(rawBody) as WebhookRequestBody;
+    const text = Buffer.isBuffer(rawBody) ? rawBody.toString("utf-8") : rawBody;
+    return JSON.parse(text) as WebhookRequestBody;
   } catch {
     return null;
   }
@@ -60,9 +60,18 @@ function parsePattern(raw: string): RegExp | null {
   }
 }
 
+// Compiling the pattern list is pure, and redaction runs per log line; keep
+// the compiled regexes per source array instead of rebuilding them each call.
+const compiledPatternsCache = new WeakMap<string[], RegExp[]>();
+
 function resolvePatterns(value?: string[]): RegExp[] {
   const source = value?.length ? value : DEFAULT_REDACT_PATTERNS;
-  return source.map(parsePattern).filter((re): re is RegExp => Boolean(re));
+  let compiled = compiledPatternsCache.get(source);
+  if (!compiled) {
+    compiled = source.map(parsePattern).filter((re): re is RegExp => Boolean(re));
+    compiledPatternsCache.set(source, compiled);
+  }
+  return compiled;
 }
 
 function maskToken(token: string): string {
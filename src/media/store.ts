@@ -1,5 +1,5 @@
 import crypto from "node:crypto";
-import { createWriteStream } from "node:fs";
+import { createReadStream, createWriteStream } from "node:fs";
 import fs from "node:fs/promises";
 import { request as httpRequest } from "node:http";
 import { request as httpsRequest } from "node:https";
@@ -219,12 +219,22 @@ export async function saveMediaSource(
   if (stat.size > MAX_BYTES) {
     throw new Error("Media exceeds 5MB limit");
   }
-  const buffer = await fs.readFile(source);
-  const mime = await detectMime({ buffer, filePath: source });
+  // Sniff only the head for mime detection and stream the copy, mirroring the
+  // download path; the file never needs to be fully resident in memory.
+  const handle = await fs.open(source, "r");
+  let sniffBuffer: Buffer;
+  try {
+    const head = Buffer.alloc(Math.min(16384, stat.size));
+    const { bytesRead } = await handle.read(head, 0, head.length, 0);
+    sniffBuffer = head.subarray(0, bytesRead);
+  } finally {
+    await handle.close();
+  }
+  const mime = await detectMime({ buffer: sniffBuffer, filePath: source });
   const ext = extensionForMime(mime) ?? path.extname(source);
   const id = ext ? `${baseId}${ext}` : baseId;
   const dest = path.join(dir, id);
-  await fs.writeFile(dest, buffer, { mode: 0o600 });
+  await pipeline(createReadStream(source), createWriteStream(dest, { mode: 0o600 }));
   return { id, path: dest, size: stat.size, contentType: mime };
 }
 
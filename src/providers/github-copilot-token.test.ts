@@ -1,5 +1,6 @@
 import { beforeEach, describe, expect, it, vi } from "vitest";
 import {
+  clearCopilotTokenMemoryCache,
   deriveCopilotApiBaseUrlFromToken,
   resolveCopilotApiToken,
 } from "./github-copilot-token.js";
@@ -12,6 +13,7 @@ describe("github-copilot token", () => {
   beforeEach(() => {
     loadJsonFile.mockReset();
     saveJsonFile.mockReset();
+    clearCopilotTokenMemoryCache();
   });
 
   it("derives baseUrl from token", async () => {
@@ -72,4 +74,30 @@ describe("github-copilot token", () => {
     expect(res.baseUrl).toBe("https://api.contoso.test");
     expect(saveJsonFile).toHaveBeenCalledTimes(1);
   });
+
+  it("serves repeat calls from memory without re-reading the cache file", async () => {
+    const now = Date.now();
+    loadJsonFile.mockReturnValue({
+      token: "cached;proxy-ep=proxy.example.com;",
+      expiresAt: now + 60 * 60 * 1000,
+      updatedAt: now,
+    });
+
+    const fetchImpl = vi.fn();
+    const params = {
+      githubToken: "gh",
+      cachePath,
+      loadJsonFileImpl: loadJsonFile,
+      saveJsonFileImpl: saveJsonFile,
+      fetchImpl: fetchImpl as unknown as typeof fetch,
+    };
+
+    await resolveCopilotApiToken(params);
+    const res = await resolveCopilotApiToken(params);
+
+    expect(res.token).toBe("cached;proxy-ep=proxy.example.com;");
+    expect(res.source).toBe("cache:memory");
+    expect(loadJsonFile).toHaveBeenCalledTimes(1);
+    expect(fetchImpl).not.toHaveBeenCalled();
+  });
 });
@@ -16,6 +16,15 @@ function resolveCopilotTokenCachePath(env: NodeJS.ProcessEnv = process.env) {
   return path.join(resolveStateDir(env), "credentials", "github-copilot.token.json");
 }
 
+// In-memory cache so repeat calls skip the disk read + JSON parse; the file
+// cache remains the source of truth across processes.
+const memoryTokenCache = new Map<string, CachedCopilotToken>();
+
+/** @internal */
+export function clearCopilotTokenMemoryCache(): void {
+  memoryTokenCache.clear();
+}
+
 function isTokenUsable(cache: CachedCopilotToken, now = Date.now()): boolean {
   // Keep a small safety margin when checking expiry.
   return cache.expiresAt - now > 5 * 60 * 1000;
@@ -95,9 +104,19 @@ export async function resolveCopilotApiToken(params: {
   const cachePath = params.cachePath?.trim() || resolveCopilotTokenCachePath(env);
   const loadJsonFileFn = params.loadJsonFileImpl ?? loadJsonFile;
   const saveJsonFileFn = params.saveJsonFileImpl ?? saveJsonFile;
+  const memoryCached = memoryTokenCache.get(cachePath);
+  if (memoryCached && isTokenUsable(memoryCached)) {
+    return {
+      token: memoryCached.token,
+      expiresAt: memoryCached.expiresAt,
+      source: "cache:memory",
+      baseUrl: deriveCopilotApiBaseUrlFromToken(memoryCached.token) ?? DEFAULT_COPILOT_API_BASE_URL,
+    };
+  }
   const cached = loadJsonFileFn(cachePath) as CachedCopilotToken | undefined;
   if (cached && typeof cached.token === "string" && typeof cached.expiresAt === "number") {
     if (isTokenUsable(cached)) {
+      memoryTokenCache.set(cachePath, cached);
       return {
         token: cached.token,
         expiresAt: cached.expiresAt,
@@ -127,6 +146,7 @@ export async function resolveCopilotApiToken(params: {
     updatedAt: Date.now(),
   };
   saveJsonFileFn(cachePath, payload);
+  memoryTokenCache.set(cachePath, payload);
 
   return {
     token: payload.token,
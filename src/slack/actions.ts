@@ -54,16 +54,36 @@ function normalizeEmoji(raw: string) {
   return trimmed.replace(/^:+|:+$/g, "");
 }
 
+// WebClient setup (HTTP agent, retry config) is not free; reuse one per token.
+const webClientCache = new Map<string, WebClient>();
+
 async function getClient(opts: SlackActionClientOpts = {}) {
+  if (opts.client) {
+    return opts.client;
+  }
   const token = resolveToken(opts.token, opts.accountId);
-  return opts.client ?? createSlackWebClient(token);
+  let client = webClientCache.get(token);
+  if (!client) {
+    client = createSlackWebClient(token);
+    webClientCache.set(token, client);
+  }
+  return client;
 }
 
+// The bot user id is fixed for a given token, so resolve it once per client
+// instead of paying an auth.test round-trip on every call.
+const botUserIdCache = new WeakMap<WebClient, string>();
+
 async function resolveBotUserId(client: WebClient) {
+  const cached = botUserIdCache.get(client);
+  if (cached) {
+    return cached;
+  }
   const auth = await client.auth.test();
   if (!auth?.user_id) {
     throw new Error("Failed to resolve Slack bot user id");
   }
+  botUserIdCache.set(client, auth.user_id);
   return auth.user_id;
 }
 
@@ -101,8 +121,11 @@ export async function removeOwnSlackReactions(
   opts: SlackActionClientOpts = {},
 ): Promise<string[]> {
   const client = await getClient(opts);
-  const userId = await resolveBotUserId(client);
-  const reactions = await listSlackReactions(channelId, messageId, { client });
+  // Who we are and what reactions exist are independent lookups.
+  const [userId, reactions] = await Promise.all([
+    resolveBotUserId(client),
+    listSlackReactions(channelId, messageId, { client }),
+  ]);
   const toRemove = new Set<string>();
   for (const reaction of reactions ?? []) {
     const name = reaction?.name;
@@ -26,10 +26,46 @@ describe("telegram download", () => {
       statusText: "OK",
       body: true,
       arrayBuffer,
-      headers: { get: () => "image/jpeg" },
+      headers: {
+        get: (name: string) =>
+          name === "content-type" ? "image/jpeg" : name === "content-length" ? "4" : null,
+      },
     } as Response);
     const saved = await downloadTelegramFile("tok", info, 1024 * 1024);
     expect(saved.path).toBeTruthy();
     expect(saved.contentType).toBe("image/jpeg");
   });
+
+  it("rejects oversize files before downloading", async () => {
+    const info: TelegramFileInfo = {
+      file_id: "fid",
+      file_path: "photos/1.jpg",
+      file_size: 2 * 1024 * 1024,
+    };
+    const fetchSpy = vi.spyOn(global, "fetch" as never);
+    fetchSpy.mockClear();
+    await expect(downloadTelegramFile("tok", info, 1024 * 1024)).rejects.toThrow(
+      "Media exceeds 1MB limit",
+    );
+    expect(fetchSpy).not.toHaveBeenCalled();
+  });
+
+  it("rejects oversize downloads reported by content-length", async () => {
+    const info: TelegramFileInfo = {
+      file_id: "fid",
+      file_path: "photos/1.jpg",
+    };
+    vi.spyOn(global, "fetch" as never).mockResolvedValueOnce({
+      ok: true,
+      status: 200,
+      statusText: "OK",
+      body: true,
+      headers: {
+        get: (name: string) => (name === "content-length" ? String(2 * 1024 * 1024) : null),
+      },
+    } as Response);
+    await expect(downloadTelegramFile("tok", info, 1024 * 1024)).rejects.toThrow(
+      "Media exceeds 1MB limit",
+    );
+  });
 });
@@ -36,11 +36,21 @@ export async function downloadTelegramFile(
   if (!info.file_path) {
     throw new Error("file_path missing");
   }
+  // Reject oversize files before transferring the payload: getFile already
+  // told us the size, and the download response carries content-length.
+  // saveMediaBuffer still enforces the limit as a backstop.
+  if (maxBytes && typeof info.file_size === "number" && info.file_size > maxBytes) {
+    throw new Error(`Media exceeds ${(maxBytes / (1024 * 1024)).toFixed(0)}MB limit`);
+  }
   const url = `https://api.telegram.org/file/bot${token}/${info.file_path}`;
   const res = await fetch(url, { signal: AbortSignal.timeout(timeoutMs) });
   if (!res.ok || !res.body) {
     throw new Error(`Failed to download telegram file: HTTP ${res.status}`);
   }
+  const contentLength = Number(res.headers.get("content-length") ?? "");
+  if (maxBytes && Number.isFinite(contentLength) && contentLength > maxBytes) {
+    throw new Error(`Media exceeds ${(maxBytes / (1024 * 1024)).toFixed(0)}MB limit`);
+  }
   const array = Buffer.from(await res.arrayBuffer());
   const mime = await detectMime({
     buffer: array,